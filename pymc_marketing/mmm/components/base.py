@@ -381,7 +381,8 @@ class Transformation:
         rng : np.random.Generator, optional
             The random number generator to use. Defaults to None.
         plot_kwargs : dict, optional
-            Keyword arguments for the DataFrame plot function. Defaults to None.
+            Keyword arguments for the LineCollection of the samples, see
+            :func:`pymc_marketing.mmm.plot.plot_samples`. Defaults to None.
         subplot_kwargs : dict, optional
             Keyword arguments for plt.subplots
         axes : npt.NDArray[plt.Axes], optional
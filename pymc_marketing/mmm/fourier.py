@@ -205,7 +205,9 @@ conflicts.
 
 """
 
-from collections.abc import Callable
+import inspect
+from collections.abc import Callable, Sequence
+from functools import cached_property, lru_cache
 from typing import Any
 
 import arviz as az
@@ -213,8 +215,11 @@ import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 import pymc as pm
+import pytensor
 import pytensor.tensor as pt
 import xarray as xr
+from pytensor.graph import Constant, Variable
+from pytensor.scalar import upcast
 
 from pymc_marketing.constants import DAYS_IN_MONTH, DAYS_IN_YEAR
 from pymc_marketing.mmm.plot import (
@@ -226,20 +231,114 @@ from pymc_marketing.prior import Prior, create_dim_handler
 
 X_NAME: str = "day"
 NON_GRID_NAMES: frozenset[str] = frozenset({X_NAME})
+DUMMY_DIM: str = "DATE"
+SUPPORTED_DTYPES: frozenset[str] = frozenset({"float32", "float64"})
+
+
+def _concrete_periods(periods: pt.TensorLike) -> npt.NDArray[Any] | None:
+    """Return the periods as a NumPy array if they are known before compilation."""
+    if isinstance(periods, Constant):
+        return np.asarray(periods.data)
+
+    if isinstance(periods, Variable):
+        return None
+
+    return np.asarray(periods)
+
+
+# Number of prior samples below which sample_prior compiles with FAST_COMPILE
+_FAST_COMPILE_MAX_SAMPLES: int = 1000
+
+# Number of samples drawn when none are given, taken from PyMC so it follows
+# any change of the default of pm.sample_prior_predictive
+_DEFAULT_PRIOR_SAMPLES: int = (
+    inspect.signature(pm.sample_prior_predictive).parameters["samples"].default
+)
+
+# Number of angles from which the numba kernel, if available, is used. Below
+# it, the JIT compilation and thread start up outweigh the gain over NumPy.
+_NUMBA_MIN_SIZE: int = 250_000
+
+
+@lru_cache(maxsize=1)
+def _numba_fourier_kernel() -> Callable | None:
+    """Numba kernel writing the fourier modes into an output array.
+
+    Returns None if numba is not installed.
+
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def kernel(periods, coeffs, out):  # pragma: no cover
+        n_order = coeffs.shape[0]
+        for i in prange(periods.shape[0]):
+            for k in range(n_order):
+                angle = coeffs[k] * periods[i]
+                out[i, k] = np.sin(angle)
+                out[i, n_order + k] = np.cos(angle)
+
+    return kernel
+
+
+def _numpy_fourier_modes(
+    periods: npt.NDArray[Any],
+    n_order: int,
+    dtype: npt.DTypeLike = np.float64,
+) -> npt.NDArray[np.floating]:
+    """Compute the fourier modes with NumPy.
+
+    The output is the only allocation: the angles are computed in place and
+    the sine and cosine are written straight into its two halves. Large grids
+    are delegated to a numba kernel when numba is installed. Everything is
+    computed in ``dtype``.
+
+    """
+    # Contiguous so the numba loop over the periods can be vectorized
+    periods = np.ascontiguousarray(periods, dtype=dtype)
+    coeffs = (2 * np.pi * np.arange(1, n_order + 1)).astype(dtype)
+    modes = np.empty((periods.shape[0], 2 * n_order), dtype=dtype)
+
+    if periods.size * n_order >= _NUMBA_MIN_SIZE and (
+        kernel := _numba_fourier_kernel()
+    ):
+        kernel(periods, coeffs, modes)
+        return modes
+
+    # The angles are stored in the cosine half so no temporary is needed
+    x = modes[:, n_order:]
+    np.multiply.outer(periods, coeffs, out=x)
+    np.sin(x, out=modes[:, :n_order])
+    np.cos(x, out=x)
+
+    return modes
 
 
 def generate_fourier_modes(
     periods: pt.TensorLike,
     n_order: int,
+    dtype: str | None = None,
 ) -> pt.TensorVariable:
     """Create fourier modes for a given period.
 
+    If the periods are concrete, e.g. a NumPy array, a pandas index or a
+    constant, the modes are computed with NumPy and returned as a constant.
+    Otherwise, for instance with ``pm.Data``, the modes are part of the
+    PyTensor graph.
+
     Parameters
     ----------
     periods : pt.TensorLike
         Periods to generate fourier modes for.
     n_order : int
         Number of fourier modes to generate.
+    dtype : str, optional
+        Data type in which the modes are computed, by default None. If None,
+        concrete periods give "float64" modes and symbolic periods are not
+        downcast below ``pytensor.config.floatX``.
 
     Returns
     -------
@@ -247,18 +346,40 @@ def generate_fourier_modes(
         Fourier modes.
 
     """
-    multiples = pt.arange(1, n_order + 1)
-    x = 2 * pt.pi * periods
-
-    values = x[:, None] * multiples
+    concrete_periods = _concrete_periods(periods)
+    if concrete_periods is not None:
+        return pt.as_tensor_variable(
+            _numpy_fourier_modes(
+                periods=concrete_periods,
+                n_order=n_order,
+                dtype=dtype or "float64",
+            ),
+        )
 
-    return pt.concatenate(
-        [
-            pt.sin(values),
-            pt.cos(values),
-        ],
-        axis=1,
+    periods = pt.as_tensor_variable(periods)
+    if dtype is None:
+        # Never less precise than the periods, and single precision for
+        # float32 periods when floatX allows it, so the graph is not upcast
+        dtype = upcast(periods.dtype, pytensor.config.floatX)
+    elif periods.dtype != dtype:
+        periods = periods.astype(dtype)
+
+    # cos(x) = sin(x + pi / 2) so both halves come out of a single sin without
+    # a Join. Each frequency appears twice, the second time phase shifted.
+    coeffs = pt.constant(
+        2 * np.pi * np.tile(np.arange(1, n_order + 1), 2),
+        name="fourier_coeffs",
+        dtype=dtype,
     )
+    phases = pt.constant(
+        np.repeat([0.0, np.pi / 2], n_order),
+        name="fourier_phases",
+        dtype=dtype,
+    )
+
+    # Broadcasting rather than pt.outer lets PyTensor fuse the product with
+    # the sin below into a single elemwise loop
+    return pt.sin(periods[:, None] * coeffs + phases)
 
 
 class FourierBase:
@@ -276,6 +397,11 @@ class FourierBase:
         default None
     name : str, optional
         Name of the variable that multiplies the fourier modes, by default None
+    dtype : str, optional
+        Data type of the fourier modes in the model, either "float64" or
+        "float32", by default "float64". Using "float32" throughout the model,
+        e.g. for sampling on GPU, also requires ``pytensor.config.floatX`` to be
+        "float32" so that the beta parameters are single precision as well.
 
     Attributes
     ----------
@@ -300,14 +426,21 @@ class FourierBase:
         prefix: str | None = None,
         prior: Prior | None = None,
         name: str | None = None,
+        dtype: str = "float64",
     ) -> None:
         if not isinstance(n_order, int) or n_order < 1:
             raise ValueError(f"n_order must be a positive integer. Not {n_order}")
 
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(
+                f"dtype must be one of {sorted(SUPPORTED_DTYPES)}. Not {dtype}"
+            )
+
         self.n_order = n_order
         self.prefix = prefix or self.prefix
         self.prior = prior or self.default_prior
         self.variable_name = name or f"{self.prefix}_beta"
+        self.dtype = dtype
 
         if self.variable_name == self.prefix:
             raise ValueError("Variable name cannot be the same as the prefix")
@@ -319,13 +452,32 @@ class FourierBase:
         if self.prefix not in self.prior.dims:
             raise ValueError(f"Prior distribution must have dimension {self.prefix}")
 
-    @property
+    @cached_property
     def nodes(self) -> list[str]:
         """Fourier node names for model coordinates."""
         return [
             f"{func}_{i}" for func in ["sin", "cos"] for i in range(1, self.n_order + 1)
         ]
 
+    @cached_property
+    def _day_basis(self) -> npt.NDArray[np.float32]:
+        """Fourier modes for each day of one full period.
+
+        Only depends on the period length and the order so it is computed once
+        per instance. It is read-only as it is shared between calls to
+        ``sample_curve``, where single precision is enough.
+
+        """
+        full_period = np.arange(self.days_in_period + 1)
+        modes = _numpy_fourier_modes(
+            periods=full_period / self.days_in_period,
+            n_order=self.n_order,
+            dtype=np.float32,
+        )
+        modes.flags.writeable = False
+
+        return modes
+
     def apply(
         self,
         dayofyear: pt.TensorLike,
@@ -374,26 +526,130 @@ class FourierBase:
                 fourier.apply(dayofyear, result_callback=callback)
 
         """
-        periods = dayofyear / self.days_in_period
+        beta = self._create_beta()
+        fourier_modes = self._compute_modes(dayofyear)
+
+        return self._combine(fourier_modes, beta, result_callback=result_callback)
+
+    def apply_many(
+        self, dayofyears: Sequence[pt.TensorLike]
+    ) -> list[pt.TensorVariable]:
+        """Apply the same fourier seasonality to several day of year arrays.
+
+        Must be used within a PyMC model context. A single beta variable is
+        created and all the day of year arrays are evaluated in one product.
+
+        Parameters
+        ----------
+        dayofyears : Sequence[pt.TensorLike]
+            Day of year arrays.
+
+        Returns
+        -------
+        list[pt.TensorVariable]
+            Fourier seasonality for each of the day of year arrays.
+
+        Examples
+        --------
+        Seasonality for the training dates and the dates to forecast.
+
+        .. code-block:: python
+
+            import pandas as pd
+
+            import pymc as pm
+
+            from pymc_marketing.mmm import YearlyFourier
+
+            fourier = YearlyFourier(n_order=3)
+
+            dates = pd.date_range("2023-01-01", periods=52, freq="W-MON")
+            future_dates = pd.date_range("2024-01-01", periods=12, freq="W-MON")
+
+            with pm.Model() as model:
+                seasonality, future_seasonality = fourier.apply_many(
+                    [
+                        dates.dayofyear.to_numpy(),
+                        future_dates.dayofyear.to_numpy(),
+                    ]
+                )
+
+        """
+        if len(dayofyears) == 0:
+            raise ValueError("dayofyears must contain at least one day of year array")
 
+        concrete_dayofyears = [
+            concrete
+            for values in dayofyears
+            if (concrete := _concrete_periods(values)) is not None
+        ]
+        all_dayofyears: pt.TensorLike
+        if len(concrete_dayofyears) == len(dayofyears):
+            all_dayofyears = np.concatenate(concrete_dayofyears)
+        else:
+            all_dayofyears = pt.concatenate(
+                [pt.as_tensor_variable(values) for values in dayofyears]
+            )
+
+        beta = self._create_beta()
+        fourier_modes = self._compute_modes(all_dayofyears)
+        result = self._combine(fourier_modes, beta)
+
+        if len(dayofyears) == 1:
+            return [result]
+
+        return pt.split(
+            result,
+            splits_size=[
+                pt.as_tensor_variable(values).shape[0] for values in dayofyears
+            ],
+            n_splits=len(dayofyears),
+            axis=0,
+        )
+
+    def _compute_modes(self, dayofyear: pt.TensorLike) -> pt.TensorVariable:
+        """Fourier modes for the day of year, without any model variable.
+
+        Does not need a PyMC model context so the modes can be compiled and
+        evaluated on their own.
+
+        """
+        return generate_fourier_modes(
+            periods=dayofyear / self.days_in_period,
+            n_order=self.n_order,
+            dtype=self.dtype,
+        )
+
+    def _create_beta(self) -> pt.TensorVariable:
         model = pm.modelcontext(None)
         model.add_coord(self.prefix, self.nodes)
 
-        beta = self.prior.create_variable(self.variable_name)
+        return self.prior.create_variable(self.variable_name)
 
-        fourier_modes = generate_fourier_modes(periods=periods, n_order=self.n_order)
+    def _combine(
+        self,
+        fourier_modes: pt.TensorVariable,
+        beta: pt.TensorVariable,
+        result_callback: Callable[[pt.TensorVariable], None] | None = None,
+    ) -> pt.TensorVariable:
+        # The dims are read at call time since the prior can be changed in place
+        dims = self.prior.dims
+        if dims == (self.prefix,):
+            if result_callback is not None:
+                result_callback(fourier_modes * beta)
 
-        DUMMY_DIM = "DATE"
+            return pt.dot(fourier_modes, beta)
 
-        prefix_idx = self.prior.dims.index(self.prefix)
-        result_dims = (DUMMY_DIM, *self.prior.dims)
-        dim_handler = create_dim_handler(result_dims)
+        prefix_idx = dims.index(self.prefix)
+        if result_callback is None:
+            # Contract the prefix dim directly rather than broadcasting and summing
+            return pt.tensordot(fourier_modes, beta, axes=[[1], [prefix_idx]])
 
+        dim_handler = create_dim_handler((DUMMY_DIM, *dims))
         result = dim_handler(fourier_modes, (DUMMY_DIM, self.prefix)) * dim_handler(
-            beta, self.prior.dims
+            beta, dims
         )
-        if result_callback is not None:
-            result_callback(result)
+        result_callback(result)
 
         return result.sum(axis=prefix_idx + 1)
 
@@ -405,7 +661,9 @@ class FourierBase:
         coords : dict, optional
             Coordinates for the prior distribution, by default None
         kwargs
-            Additional keywords for sample_prior_predictive
+            Additional keywords for sample_prior_predictive. Unless
+            ``compile_kwargs`` are given, fewer than 1000 samples are drawn
+            with the "FAST_COMPILE" mode.
 
         Returns
         -------
@@ -415,6 +673,12 @@ class FourierBase:
         """
         coords = coords or {}
         coords[self.prefix] = self.nodes
+
+        # Compiling dominates when only a few samples are drawn. A new dict each
+        # time as sample_prior_predictive adds its own keys to it.
+        if kwargs.get("samples", _DEFAULT_PRIOR_SAMPLES) < _FAST_COMPILE_MAX_SAMPLES:
+            kwargs.setdefault("compile_kwargs", {"mode": "FAST_COMPILE"})
+
         return self.prior.sample_prior(coords=coords, name=self.variable_name, **kwargs)
 
     def sample_curve(self, parameters: az.InferenceData | xr.Dataset) -> xr.DataArray:
@@ -429,30 +693,38 @@ class FourierBase:
         Returns
         -------
         xr.DataArray
-            Full period of the fourier seasonality.
+            Full period of the fourier seasonality in single precision.
 
         """
-        full_period = np.arange(self.days_in_period + 1)
-        coords = {
-            "day": full_period,
-        }
-        for key, values in parameters[self.variable_name].coords.items():
-            if key in {"chain", "draw", self.prefix}:
-                continue
-            coords[key] = values.to_numpy()
-
-        with pm.Model(coords=coords):
-            name = f"{self.prefix}_trend"
-            pm.Deterministic(
-                name,
-                self.apply(dayofyear=full_period),
-                dims=tuple(coords.keys()),
-            )
+        full_period = np.arange(self.days_in_period + 1, dtype=np.int32)
+        design = self._day_basis
+
+        beta = parameters[self.variable_name]
+        other_dims = tuple(
+            dim for dim in beta.dims if dim not in {"chain", "draw", self.prefix}
+        )
+        beta = beta.transpose("chain", "draw", *other_dims, self.prefix)
+
+        # The curve only depends on beta so no model is needed. All the samples
+        # are stacked in order to compute it with a single matrix product.
+        beta_values = np.ascontiguousarray(beta.to_numpy(), dtype=np.float32)
+        values = beta_values.reshape(-1, design.shape[1]) @ design.T
+
+        curve = xr.DataArray(
+            values.reshape(*beta_values.shape[:-1], design.shape[0]),
+            dims=("chain", "draw", *other_dims, "day"),
+            coords={
+                **{
+                    name: coord
+                    for name, coord in beta.coords.items()
+                    if self.prefix not in coord.dims
+                },
+                "day": full_period,
+            },
+            name=f"{self.prefix}_trend",
+        )
 
-            return pm.sample_posterior_predictive(
-                parameters,
-                var_names=[name],
-            ).posterior_predictive[name]
+        return curve.transpose("chain", "draw", "day", *other_dims)
 
     def plot_curve(
         self,
@@ -545,7 +817,8 @@ class FourierBase:
         rng : np.random.Generator, optional
             Random number generator, by default None
         plot_kwargs : dict, optional
-            Keyword arguments for the plot function, by default None
+            Keyword arguments for the LineCollection of the samples, see
+            :func:`pymc_marketing.mmm.plot.plot_samples`, by default None
         subplot_kwargs : dict, optional
             Keyword arguments for the subplot, by default None
         axes : npt.NDArray[plt.Axes], optional
@@ -607,6 +880,9 @@ class YearlyFourier(FourierBase):
     prior : Prior, optional
         Prior distribution for the fourier seasonality beta parameters, by
         default None
+    dtype : str, optional
+        Data type of the fourier modes in the model, either "float64" or
+        "float32", by default "float64"
 
     Attributes
     ----------
@@ -662,6 +938,9 @@ class MonthlyFourier(FourierBase):
     prior : Prior, optional
         Prior distribution for the fourier seasonality beta parameters, by
         default None
+    dtype : str, optional
+        Data type of the fourier modes in the model, either "float64" or
+        "float32", by default "float64"
 
     Attributes
     ----------
@@ -21,6 +21,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 import xarray as xr
+from matplotlib.collections import LineCollection
 
 Values = Sequence[Any] | npt.NDArray[Any]
 Coords = dict[str, Values]
@@ -182,7 +183,9 @@ def plot_samples(
     subplot_kwargs : dict, optional
         Additional kwargs to while creating the fig and axes
     plot_kwargs : dict, optional
-        Kwargs for the plot function
+        Kwargs for the LineCollection holding the samples of each axes, e.g.
+        alpha, linewidth or linestyle. A "legend" key, as accepted by the
+        DataFrame plot function, is ignored since the samples are not labeled
 
     Returns
     -------
@@ -206,9 +209,10 @@ def plot_samples(
 
     plot_kwargs = plot_kwargs or {}
     plot_kwargs = {
-        **{"alpha": 0.3, "legend": False},
+        **{"alpha": 0.3},
         **plot_kwargs,
     }
+    plot_kwargs.pop("legend", None)
 
     rng = rng or np.random.default_rng()
     idx = random_samples(
@@ -223,7 +227,16 @@ def plot_samples(
         df_curve = curve.sel(sel).to_series().unstack()
         df_sample = df_curve.loc[idx, :]
 
-        df_sample.T.plot(ax=ax, color=color, **plot_kwargs)
+        # A single artist for all the samples instead of one line each. The x
+        # values, e.g. dates, are converted to axis units first as a
+        # LineCollection only takes numbers
+        x = df_sample.columns.to_numpy()
+        ax.xaxis.update_units(x)
+        x = ax.convert_xunits(x)
+        segments = np.stack(np.broadcast_arrays(x, df_sample.to_numpy()), axis=-1)
+        ax.add_collection(LineCollection(segments, color=color, **plot_kwargs))
+        ax.autoscale_view()
+        ax.set_xlabel(df_sample.columns.name)
         title = ", ".join(f"{name}={value}" for name, value in sel.items())
         ax.set_title(title)
 
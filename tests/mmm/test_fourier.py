@@ -13,10 +13,15 @@
 #   limitations under the License.
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 import pymc as pm
+import pytensor
+import pytensor.tensor as pt
 import pytest
 import xarray as xr
+from pytensor.graph import Constant
 
+from pymc_marketing.mmm import fourier as fourier_module
 from pymc_marketing.mmm.fourier import YearlyFourier, generate_fourier_modes
 from pymc_marketing.prior import Prior
 
@@ -41,22 +46,43 @@ def test_nodes() -> None:
     assert yearly.nodes == ["sin_1", "sin_2", "cos_1", "cos_2"]
 
 
-def test_sample_prior() -> None:
-    n_order = 2
-    yearly = YearlyFourier(n_order=n_order)
-    prior = yearly.sample_prior(samples=10)
+@pytest.fixture(scope="module")
+def yearly_prior() -> tuple[YearlyFourier, xr.Dataset]:
+    yearly = YearlyFourier(n_order=2)
+
+    return yearly, yearly.sample_prior(samples=10)
+
+
+def test_sample_prior(yearly_prior) -> None:
+    yearly, prior = yearly_prior
 
     assert prior.sizes == {
         "chain": 1,
         "draw": 10,
-        yearly.prefix: n_order * 2,
+        yearly.prefix: yearly.n_order * 2,
     }
 
 
-def test_sample_curve() -> None:
-    n_order = 2
-    yearly = YearlyFourier(n_order=n_order)
-    prior = yearly.sample_prior(samples=10)
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"samples": 10}, {"mode": "FAST_COMPILE"}),
+        ({}, {"mode": "FAST_COMPILE"}),
+        ({"samples": 1000}, None),
+        ({"samples": 10, "compile_kwargs": {"mode": "FAST_RUN"}}, {"mode": "FAST_RUN"}),
+    ],
+)
+def test_sample_prior_compile_kwargs(mocker, kwargs, expected) -> None:
+    yearly = YearlyFourier(n_order=2)
+    sample_prior = mocker.patch.object(yearly.prior, "sample_prior")
+
+    yearly.sample_prior(**kwargs)
+
+    assert sample_prior.call_args.kwargs.get("compile_kwargs") == expected
+
+
+def test_sample_curve(yearly_prior) -> None:
+    yearly, prior = yearly_prior
     curve = yearly.sample_curve(prior)
 
     assert curve.sizes == {
@@ -64,18 +90,52 @@ def test_sample_curve() -> None:
         "draw": 10,
         "day": 367,
     }
+    assert curve.dtype == np.float32
+    assert curve.coords["day"].dtype == np.int32
+
+
+def test_sample_curve_values(yearly_prior) -> None:
+    yearly, prior = yearly_prior
+    curve = yearly.sample_curve(prior)
+
+    day = curve.coords["day"].to_numpy()
+    fourier_modes = generate_fourier_modes(
+        periods=day / yearly.days_in_period,
+        n_order=yearly.n_order,
+    ).eval()
+    beta = prior[yearly.variable_name].isel(chain=0, draw=0).to_numpy()
+
+    np.testing.assert_allclose(
+        curve.isel(chain=0, draw=0).to_numpy(),
+        fourier_modes @ beta,
+        rtol=1e-5,
+        atol=1e-5,
+    )
 
 
-def create_mock_variable(coords):
+def test_day_basis_is_cached() -> None:
+    n_order = 2
+    yearly = YearlyFourier(n_order=n_order)
+
+    basis = yearly._day_basis
+
+    assert basis is yearly._day_basis
+    assert basis.shape == (367, n_order * 2)
+    assert basis.dtype == np.float32
+    assert not basis.flags.writeable
+
+
+def create_mock_variable(coords, dtype=np.float32):
     shape = [len(values) for values in coords.values()]
 
+    # Read-only view of a single value, nothing is allocated for the full shape
     return xr.DataArray(
-        np.ones(shape),
+        np.broadcast_to(np.ones((), dtype=dtype), shape),
         coords=coords,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_parameters() -> xr.Dataset:
     n_chains = 1
     n_draws = 250
@@ -94,7 +154,9 @@ def mock_parameters() -> xr.Dataset:
                     "chain": np.arange(n_chains),
                     "draw": np.arange(n_draws),
                     "additional_dim": np.arange(10),
-                }
+                },
+                # Never read by sample_curve
+                dtype=np.bool_,
             ).rename("another_larger_variable"),
         },
     )
@@ -111,6 +173,25 @@ def test_sample_curve_additional_dims(mock_parameters) -> None:
     }
 
 
+def test_sample_curve_returns_new_array(mock_parameters) -> None:
+    yearly = YearlyFourier(n_order=2)
+    first = yearly.sample_curve(mock_parameters)
+    second = yearly.sample_curve(mock_parameters)
+
+    assert not np.shares_memory(first.to_numpy(), second.to_numpy())
+
+
+def test_sample_curve_without_pymc(mock_parameters, mocker) -> None:
+    deterministic = mocker.patch("pymc.Deterministic")
+    sample_posterior_predictive = mocker.patch("pymc.sample_posterior_predictive")
+
+    yearly = YearlyFourier(n_order=2)
+    yearly.sample_curve(mock_parameters)
+
+    deterministic.assert_not_called()
+    sample_posterior_predictive.assert_not_called()
+
+
 def test_additional_dimension() -> None:
     prior = Prior("Normal", dims=("fourier", "additional_dim", "yet_another_dim"))
     yearly = YearlyFourier(n_order=2, prior=prior)
@@ -146,6 +227,27 @@ def test_plot_curve() -> None:
     assert axes.shape == (2, 2)
 
 
+@pytest.fixture(scope="module")
+def evaluate_fourier_modes():
+    functions: dict[int, pytensor.compile.Function] = {}
+
+    def evaluate(periods: np.ndarray, n_order: int, symbolic: bool) -> np.ndarray:
+        if not symbolic:
+            return generate_fourier_modes(periods=periods, n_order=n_order).eval()
+
+        # One compiled function per order, shared by all the periods
+        if n_order not in functions:
+            symbolic_periods = pt.vector("periods", dtype="float64")
+            functions[n_order] = pytensor.function(
+                [symbolic_periods],
+                generate_fourier_modes(periods=symbolic_periods, n_order=n_order),
+            )
+
+        return functions[n_order](periods)
+
+    return evaluate
+
+
 @pytest.mark.parametrize("n_order", [0, -1, -100, 2.5])
 def test_bad_order(n_order) -> None:
     with pytest.raises(ValueError, match="n_order must be a positive integer"):
@@ -180,6 +282,7 @@ def test_fourier_modes_range(periods, n_order):
     assert fourier_modes.max() <= 1.0
 
 
+@pytest.mark.parametrize("symbolic", [False, True])
 @pytest.mark.parametrize(
     "periods, n_order",
     [
@@ -188,8 +291,10 @@ def test_fourier_modes_range(periods, n_order):
         (np.linspace(start=-15, stop=5.0, num=160), 20),
     ],
 )
-def test_fourier_modes_frequency_integer_range(periods, n_order):
-    fourier_modes = generate_fourier_modes(periods=periods, n_order=n_order).eval()
+def test_fourier_modes_frequency_integer_range(
+    evaluate_fourier_modes, periods, n_order, symbolic
+):
+    fourier_modes = evaluate_fourier_modes(periods, n_order, symbolic)
 
     assert (fourier_modes[:, :n_order].mean(axis=0) < 1e-10).all()
     assert (fourier_modes[:-1, n_order:].mean(axis=0) < 1e-10).all()
@@ -200,6 +305,7 @@ def test_fourier_modes_frequency_integer_range(periods, n_order):
     assert fourier_modes[fourier_modes == 1].shape
 
 
+@pytest.mark.parametrize("symbolic", [False, True])
 @pytest.mark.parametrize(
     "periods, n_order",
     [
@@ -211,11 +317,109 @@ def test_fourier_modes_frequency_integer_range(periods, n_order):
         (np.linspace(start=-100.0, stop=-5.0, num=160), 20),
     ],
 )
-def test_fourier_modes_pythagoras(periods, n_order):
-    fourier_modes = generate_fourier_modes(periods=periods, n_order=n_order).eval()
-    norm = fourier_modes[:, :n_order] ** 2 + fourier_modes[:, n_order:] ** 2
+def test_fourier_modes_pythagoras(evaluate_fourier_modes, periods, n_order, symbolic):
+    fourier_modes = evaluate_fourier_modes(periods, n_order, symbolic)
+    sin = fourier_modes[:, :n_order]
+    cos = fourier_modes[:, n_order:]
+
+    np.testing.assert_allclose(sin * sin + cos * cos, 1.0, rtol=0, atol=1e-10)
+
+
+def test_fourier_modes_concrete_matches_symbolic() -> None:
+    periods = np.linspace(start=-1.0, stop=1.0, num=50)
+    n_order = 5
+
+    concrete = generate_fourier_modes(periods=periods, n_order=n_order)
+    symbolic = generate_fourier_modes(
+        periods=pt.as_tensor(periods) + 0, n_order=n_order
+    )
+
+    assert isinstance(concrete, Constant)
+    assert not isinstance(symbolic, Constant)
+    np.testing.assert_allclose(concrete.eval(), symbolic.eval(), atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "dtype, atol", [("float64", 1e-10), ("float32", 1e-4)], ids=["float64", "float32"]
+)
+def test_fourier_modes_numba_kernel(monkeypatch, dtype, atol) -> None:
+    pytest.importorskip("numba")
+
+    # Every other value of a larger grid so the periods are not contiguous
+    periods = np.linspace(start=-10.0, stop=2.0, num=340)[::2]
+    n_order = 20
+    expected = generate_fourier_modes(periods=periods, n_order=n_order).eval()
+
+    monkeypatch.setattr(fourier_module, "_NUMBA_MIN_SIZE", 0)
+    result = generate_fourier_modes(periods=periods, n_order=n_order, dtype=dtype)
+
+    assert result.dtype == dtype
+    np.testing.assert_allclose(result.eval(), expected, atol=atol)
+
+
+@pytest.mark.parametrize(
+    "floatX, dtype, expected_dtype",
+    [
+        ("float64", "float32", "float64"),
+        ("float64", "float64", "float64"),
+        ("float32", "float32", "float32"),
+        ("float32", "float64", "float64"),
+        ("float32", "int64", "float64"),
+    ],
+)
+def test_symbolic_fourier_modes_dtype(floatX, dtype, expected_dtype) -> None:
+    periods = pt.vector("periods", dtype=dtype)
+    with pytensor.config.change_flags(floatX=floatX):
+        fourier_modes = generate_fourier_modes(periods=periods, n_order=2)
+
+    assert fourier_modes.dtype == expected_dtype
+
+
+@pytest.mark.parametrize("symbolic", [False, True])
+def test_fourier_modes_float32(symbolic) -> None:
+    periods = np.linspace(start=-1.0, stop=1.0, num=50)
+    n_order = 5
+    expected = generate_fourier_modes(periods=periods, n_order=n_order).eval()
+
+    if symbolic:
+        periods = pt.as_tensor(periods) + 0
+    fourier_modes = generate_fourier_modes(
+        periods=periods, n_order=n_order, dtype="float32"
+    )
 
-    assert (abs(norm - 1) < 1e-10).all()
+    assert fourier_modes.dtype == "float32"
+    np.testing.assert_allclose(fourier_modes.eval(), expected, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "periods",
+    [
+        np.linspace(start=0.0, stop=1.0, num=10),
+        list(np.linspace(start=0.0, stop=1.0, num=10)),
+        pd.Index(np.linspace(start=0.0, stop=1.0, num=10)),
+        pt.constant(np.linspace(start=0.0, stop=1.0, num=10)),
+    ],
+    ids=["array", "list", "index", "constant"],
+)
+def test_fourier_modes_concrete_inputs(periods) -> None:
+    fourier_modes = generate_fourier_modes(periods=periods, n_order=3)
+
+    assert isinstance(fourier_modes, Constant)
+    assert fourier_modes.eval().shape == (10, 6)
+
+
+def test_compute_modes() -> None:
+    n_order = 3
+    fourier = YearlyFourier(n_order=n_order)
+
+    dayofyear = np.arange(365)
+    fn = pytensor.function([], fourier._compute_modes(dayofyear))
+
+    expected = generate_fourier_modes(
+        periods=dayofyear / fourier.days_in_period,
+        n_order=n_order,
+    ).eval()
+    np.testing.assert_allclose(fn(), expected)
 
 
 def test_apply_result_callback() -> None:
@@ -240,6 +444,132 @@ def test_apply_result_callback() -> None:
     assert model["components"].eval().shape == (365, n_order * 2)
 
 
+@pytest.mark.parametrize("result_callback", [None, lambda _: None])
+@pytest.mark.parametrize(
+    "dims",
+    [
+        ("fourier",),
+        ("fourier", "hierarchy"),
+        ("hierarchy", "fourier", "another_dim"),
+    ],
+)
+def test_apply_values(dims, result_callback) -> None:
+    n_order = 2
+    prior = Prior("Normal", dims=dims)
+    fourier = YearlyFourier(n_order=n_order, prior=prior)
+
+    dayofyear = np.arange(365)
+    coords = {"hierarchy": ["A", "B"], "another_dim": range(3)}
+    with pm.Model(coords=coords) as model:
+        result = fourier.apply(dayofyear, result_callback=result_callback)
+
+    result_draw, beta_draw = pm.draw(
+        [result, model[fourier.variable_name]],
+        random_seed=1,
+    )
+    fourier_modes = generate_fourier_modes(
+        periods=dayofyear / fourier.days_in_period,
+        n_order=n_order,
+    ).eval()
+    expected = np.tensordot(
+        fourier_modes,
+        beta_draw,
+        axes=[[1], [dims.index(fourier.prefix)]],
+    )
+
+    np.testing.assert_allclose(result_draw, expected)
+
+
+@pytest.mark.parametrize("result_callback", [None, lambda _: None])
+def test_apply_prior_dims_changed_in_place(result_callback) -> None:
+    n_order = 2
+    prior = Prior("Normal", dims="fourier")
+    fourier = YearlyFourier(n_order=n_order, prior=prior)
+    prior.dims = ("geo", "fourier")
+
+    dayofyear = np.arange(365)
+    coords = {"geo": ["A", "B", "C", "D"]}
+    with pm.Model(coords=coords) as model:
+        result = fourier.apply(dayofyear, result_callback=result_callback)
+
+    result_draw, beta_draw = pm.draw(
+        [result, model[fourier.variable_name]],
+        random_seed=1,
+    )
+    fourier_modes = generate_fourier_modes(
+        periods=dayofyear / fourier.days_in_period,
+        n_order=n_order,
+    ).eval()
+
+    np.testing.assert_allclose(result_draw, fourier_modes @ beta_draw.T)
+
+
+@pytest.mark.parametrize("dims", [("fourier",), ("hierarchy", "fourier")])
+@pytest.mark.parametrize("use_data", [False, True])
+@pytest.mark.parametrize("n_arrays", [1, 2])
+def test_apply_many(n_arrays, dims, use_data) -> None:
+    n_order = 2
+    prior = Prior("Normal", dims=dims)
+    fourier = YearlyFourier(n_order=n_order, prior=prior)
+
+    dayofyears = [np.arange(1, 53), np.arange(100, 112)][:n_arrays]
+    with pm.Model(coords={"hierarchy": ["A", "B"]}) as model:
+        if use_data:
+            dayofyears = [
+                pm.Data(f"dayofyear_{i}", dayofyear)
+                for i, dayofyear in enumerate(dayofyears)
+            ]
+        results = fourier.apply_many(dayofyears)
+
+    assert len(results) == len(dayofyears)
+    *result_draws, beta_draw = pm.draw(
+        [*results, model[fourier.variable_name]],
+        random_seed=1,
+    )
+    for dayofyear, result_draw in zip(dayofyears, result_draws, strict=True):
+        if use_data:
+            dayofyear = dayofyear.get_value()
+        fourier_modes = generate_fourier_modes(
+            periods=dayofyear / fourier.days_in_period,
+            n_order=n_order,
+        ).eval()
+        expected = np.tensordot(
+            fourier_modes,
+            beta_draw,
+            axes=[[1], [dims.index(fourier.prefix)]],
+        )
+
+        np.testing.assert_allclose(result_draw, expected, atol=1e-12)
+
+
+def test_apply_many_empty() -> None:
+    fourier = YearlyFourier(n_order=2)
+
+    with pm.Model():
+        with pytest.raises(ValueError, match="dayofyears must contain"):
+            fourier.apply_many([])
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("use_data", [False, True])
+def test_fourier_modes_dtype(dtype, use_data) -> None:
+    fourier = YearlyFourier(n_order=2, dtype=dtype)
+
+    dayofyear = np.arange(365)
+    with pm.Model():
+        if use_data:
+            dayofyear = pm.Data("dayofyear", dayofyear)
+
+        fourier_modes = fourier._compute_modes(dayofyear)
+
+    assert fourier_modes.dtype == dtype
+
+
+def test_bad_dtype() -> None:
+    with pytest.raises(ValueError, match="dtype must be one of"):
+        YearlyFourier(n_order=2, dtype="bfloat16")
+
+
 def test_error_with_prefix_and_name() -> None:
     name = "variable_name"
     with pytest.raises(ValueError, match="Variable name cannot"):
@@ -11,11 +11,13 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
+from matplotlib.collections import LineCollection
 
 from pymc_marketing.mmm.plot import (
     plot_hdi,
@@ -98,6 +100,45 @@ def test_plot_samples(mock_curve) -> None:
     assert isinstance(fig, plt.Figure)
 
 
+def test_plot_samples_single_collection(mock_curve) -> None:
+    n = 3
+    _, axes = plot_samples(mock_curve, non_grid_names={"chain", "draw", "day"}, n=n)
+
+    for ax in axes.ravel():
+        assert not ax.get_lines()
+        (collection,) = ax.collections
+        assert isinstance(collection, LineCollection)
+        assert len(collection.get_segments()) == n
+        assert (ax.dataLim.x0, ax.dataLim.x1) == (0, 30)
+
+
+def test_plot_samples_plot_kwargs(mock_curve) -> None:
+    plot_kwargs = {"legend": True, "linewidth": 2, "linestyle": "--"}
+    _, axes = plot_samples(
+        mock_curve, non_grid_names={"chain", "draw", "day"}, plot_kwargs=plot_kwargs
+    )
+
+    for ax in axes.ravel():
+        (collection,) = ax.collections
+        np.testing.assert_array_equal(collection.get_linewidth(), [2])
+        assert ax.get_legend() is None
+
+
+def test_plot_samples_datetime_coord() -> None:
+    dates = pd.date_range("2024-01-01", periods=31, freq="D")
+    curve = xr.DataArray(
+        np.ones((1, 15, 31)),
+        coords={"chain": np.arange(1), "draw": np.arange(15), "date": dates},
+    )
+
+    _, axes = plot_samples(curve, non_grid_names={"chain", "draw", "date"}, n=3)
+
+    (ax,) = axes
+    left, right = mdates.num2date(ax.get_xlim())
+    assert left.date() <= dates[0].date()
+    assert right.date() >= dates[-1].date()
+
+
 def test_plot_hdi(mock_curve) -> None:
     fig, axes = plot_hdi(mock_curve, non_grid_names={"day"})
 